@@ -1,16 +1,55 @@
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 from datetime import datetime, time, timedelta
 import time
 import os
+import sys
+import random
+import asyncio
 import json
-from typing import Dict, List, Tuple, Optional, Any
+import math
+import logging
+import logging.handlers
+import queue
+import heapq
+import operator
+import threading
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional, Any, NamedTuple, Union
 from dotenv import load_dotenv
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; kernels run as plain Python without it
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that returns the function uncompiled"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the standard library parser
+    _json_loads = json.loads
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; only needed for PerformanceTracker.as_table()
+    pa = None
+
 # Load environment variables from .env file
 load_dotenv()
 
+log = logging.getLogger("sector_rotation")
+
+# Queue feeding the background log writer while main() runs (see _start_logging)
+_log_queue: Optional[queue.Queue] = None
+
 # Configuration
 class Config:
     # API Configuration
@@ -25,7 +64,26 @@ class Config:
     
     if not all([MT5_LOGIN, MT5_PASSWORD, MT5_SERVER]):
         raise ValueError("Missing MT5 credentials in environment variables")
+    
+    # The MT5 login is an account number
+    try:
+        MT5_LOGIN = int(MT5_LOGIN)
+    except ValueError:
+        raise ValueError("MT5_LOGIN must be a numeric MT5 account number") from None
         
+    # Maximum number of API requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 5
+    
+    # Symbol metadata rarely changes; cache it for 24 hours
+    SYMBOL_INFO_TTL = 24 * 60 * 60
+    
+    # Number of most recent trades kept in the trade history
+    TRADE_HISTORY_CAP = 10000
+    
+    # Attempts per cycle to fetch the benchmark, and the longest wait between them (seconds)
+    BENCHMARK_ATTEMPTS = 5
+    BENCHMARK_MAX_BACKOFF = 30
+    
     # Updated API base URL
     API_BASE_URL = "https://metasyc.p.rapidapi.com"
     
@@ -55,12 +113,6 @@ class Config:
         'history_orders': '/history_orders'
     }
     
-    # Request headers
-    HEADERS = {
-        "X-RapidAPI-Key": RAPIDAPI_KEY,
-        "Content-Type": "application/json"
-    }
-    
     # Sector ETF symbols available through MetaSync/IC Markets
     SECTORS = {
         'Financials': 'XLF',
@@ -98,119 +150,245 @@ class Config:
         'trading_hours_only': True,    # Only trade during market hours
     }
 
+# Column layout of OHLC candle arrays returned by MetaSyncAPI.get_ohlc
+OHLC_DTYPE = np.dtype([
+    ('time', 'i8'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'f8'),
+])
+
+# Full URL for each endpoint path, built once
+_ENDPOINT_URLS = {path: Config.API_BASE_URL + path for path in Config.ENDPOINTS.values()}
+
+# Dashboard label for each signal code returned by compute_signals
+SIGNAL_LABELS = np.array(["🔴 WEAK", "🟡 NEUTRAL", "🟢 STRONG"])
+
+@njit('Tuple((float64[:], int8[:]))(float64[:], float64)', cache=True, fastmath=True)
+def compute_signals(change: np.ndarray, bench_change: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate relative strength and signal codes for each sector
+    
+    Args:
+        change: Daily change (%) per sector
+        bench_change: Daily change (%) of the benchmark
+        
+    Returns:
+        Tuple of (relative strength, signal code) arrays where the signal code
+        is 2 for STRONG (RS > 1.0%), 1 for NEUTRAL (RS > 0.5%) and 0 for WEAK
+    """
+    rs = change - bench_change
+    sig = np.empty(rs.size, dtype=np.int8)
+    for i in range(rs.size):
+        # Count thresholds passed instead of branching
+        sig[i] = int(rs[i] > 0.5) + int(rs[i] > 1.0)
+    return rs, sig
+
+# Explicit signature: compiled at import (then loaded from the on-disk cache) instead of on the first metrics call.
+# No fastmath here: it would let the compiler reassociate away the Kahan compensation.
+@njit('Tuple((int64, int64))(float64[:], float64[:])', cache=True)
+def _metrics_kernel(profits: np.ndarray, acc: np.ndarray) -> Tuple[int, int]:
+    """
+    Fold trade profits into running win/loss sums in a single pass
+    
+    Sums use Kahan compensation so rounding error does not build up over long runs.
+    
+    Args:
+        profits: Trade profits to add
+        acc: Running [sum of wins, win compensation, sum of losses, loss compensation], updated in place
+        
+    Returns:
+        Tuple of (winning trades, losing trades) in profits
+    """
+    n_win = 0
+    n_loss = 0
+    sum_win, c_win, sum_loss, c_loss = acc[0], acc[1], acc[2], acc[3]
+    for i in range(profits.size):
+        p = profits[i]
+        if p > 0:
+            n_win += 1
+            y = p - c_win
+            t = sum_win + y
+            c_win = (t - sum_win) - y
+            sum_win = t
+        else:
+            n_loss += 1
+            y = p - c_loss
+            t = sum_loss + y
+            c_loss = (t - sum_loss) - y
+            sum_loss = t
+    acc[0] = sum_win
+    acc[1] = c_win
+    acc[2] = sum_loss
+    acc[3] = c_loss
+    return n_win, n_loss
+
+@dataclass
+class SectorSnapshot:
+    """Sector data for one update cycle, stored as parallel arrays (one entry per sector)"""
+    sectors: np.ndarray
+    symbols: np.ndarray
+    prices: np.ndarray
+    changes: np.ndarray
+    volumes: np.ndarray
+    timestamp: str
+    rel_strength: Optional[np.ndarray] = None
+    signals: Optional[np.ndarray] = None
+    
+    def __len__(self) -> int:
+        return len(self.sectors)
+    
+    @property
+    def empty(self) -> bool:
+        return len(self.sectors) == 0
+
 class MetaSyncAPI:
     """Wrapper for MetaSync API calls with rate limiting"""
     
     def __init__(self):
         self.last_request_time = 0
         self.min_request_interval = 1.0  # Minimum seconds between requests
+        self.max_retries = 5  # Attempts per request when rate limited
         self.connected = False
+        self._rate_lock = threading.Lock()
+        self._symbol_info_cache: Dict[str, Tuple[float, dict]] = {}
+        
+        # Persistent session so connections (and TLS handshakes) are reused
+        self.session = requests.Session()
+        self.session.headers.update(Config.HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        
+        # Connection data, built once and reused on reconnects
+        self._connection_payload = {
+            'login': Config.MT5_LOGIN,
+            'password': Config.MT5_PASSWORD,
+            'server': Config.MT5_SERVER,
+            'path': "",  # Empty path for default terminal location
+            'timeout': 10000  # 10 seconds timeout
+        }
     
     def _rate_limit(self):
-        """Enforce rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
+        """Enforce rate limiting (thread-safe: each caller reserves its own slot)"""
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self.last_request_time + self.min_request_interval)
+            self.last_request_time = slot
+        if slot > now:
+            time.sleep(slot - now)
     
     def _make_request(self, endpoint: str, method: str = 'GET', **kwargs) -> dict:
-        """Make an API request with rate limiting and error handling"""
-        self._rate_limit()
-        
-        url = f"{Config.API_BASE_URL}{endpoint}"
-        headers = {**Config.HEADERS, **kwargs.pop('headers', {})}
+        """Make an API request with rate limiting, retries and error handling"""
+        url = _ENDPOINT_URLS[endpoint]
+        # Default headers are set on the session; only pass per-request overrides
+        headers = kwargs.pop('headers', None)
         
         # Log request details (without sensitive data)
-        log_params = {k: v for k, v in kwargs.items() if k not in ['password', 'api_key']}
-        print(f"🔹 API Request: {method} {endpoint}")
-        if log_params:
-            print(f"   Params: {log_params}")
+        log.debug("API Request: %s %s", method, endpoint)
+        if kwargs and log.isEnabledFor(logging.DEBUG):
+            log_params = {k: v for k, v in kwargs.items() if k not in ['password', 'api_key']}
+            log.debug("Params: %s", log_params)
         
-        try:
-            start_time = time.time()
-            
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, params=kwargs, timeout=15)
-            elif method.upper() == 'POST':
-                # For POST requests, move params to json body
-                json_data = kwargs.pop('json', kwargs)
-                response = requests.post(url, headers=headers, json=json_data, timeout=15)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            # Log response time
-            response_time = (time.time() - start_time) * 1000  # in milliseconds
-            
-            # Handle rate limiting
-            if response.status_code == 429:  # Too Many Requests
-                retry_after = int(response.headers.get('Retry-After', 5))
-                print(f"  ⚠️  Rate limited. Waiting {retry_after} seconds...")
-                time.sleep(retry_after)
-                # Retry the request once after waiting
-                return self._make_request(endpoint, method, **kwargs)
-            
-            response.raise_for_status()
-            
-            # Log successful response
-            print(f"  ✅ Response in {response_time:.2f}ms")
-            
-            self.last_request_time = time.time()
-            return response.json()
+        method = method.upper()
+        if method == 'POST':
+            # For POST requests, move params to json body
+            json_data = kwargs.pop('json', kwargs)
+        elif method != 'GET':
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        for attempt in range(self.max_retries):
+            self._rate_limit()
             
-        except requests.exceptions.RequestException as e:
-            error_msg = f"❌ API request failed for {endpoint}: {str(e)}"
-            if hasattr(e, 'response') and e.response is not None:
-                error_msg += f" (Status: {e.response.status_code})"
-                try:
-                    error_details = e.response.json()
-                    error_msg += f"\n  Details: {error_details}"
-                except:
-                    error_msg += f"\n  Response: {e.response.text[:200]}"
+            try:
+                start_time = time.time()
+                
+                if method == 'GET':
+                    response = self.session.get(url, headers=headers, params=kwargs, timeout=15)
+                else:
+                    response = self.session.post(url, headers=headers, json=json_data, timeout=15)
+                
+                # Log response time
+                response_time = (time.time() - start_time) * 1000  # in milliseconds
+                
+                # Handle rate limiting: back off exponentially (with jitter) and retry,
+                # the final attempt falls through to raise_for_status
+                if response.status_code == 429 and attempt < self.max_retries - 1:  # Too Many Requests
+                    retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                    delay = min(retry_after, 2 ** attempt) + random.uniform(0, 0.5)
+                    log.warning("Rate limited. Retrying in %.1f seconds...", delay)
+                    time.sleep(delay)
+                    continue
+                
+                response.raise_for_status()
+                
+                # Log successful response
+                log.debug("Response in %.2fms", response_time)
+                
+            except requests.exceptions.RequestException as e:
+                if getattr(e, 'response', None) is not None:
+                    try:
+                        details = e.response.json()
+                    except ValueError:
+                        details = e.response.text[:200]
+                    log.error("API request failed for %s: %s (Status: %s, Details: %s)",
+                              endpoint, e, e.response.status_code, details)
+                else:
+                    log.error("API request failed for %s: %s", endpoint, e)
+                return {"error": True, "message": str(e)}
             
-            print(error_msg)
-            return {"error": True, "message": str(e)}
+            try:
+                return _json_loads(response.content)
+            except ValueError as e:
+                log.error("Invalid JSON response for %s: %s", endpoint, e)
+                return {"error": True, "message": str(e)}
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str], default: float = 5.0) -> float:
+        """Seconds from a Retry-After header; the HTTP-date form and bad values fall back to the default"""
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return default
     
     def connect(self) -> bool:
         """Connect to MetaTrader5 terminal"""
         if self.connected:
             return True
             
-        print(f"Connecting to MetaTrader5 terminal (Server: {Config.MT5_SERVER})...")
-        
-        # Prepare connection data
-        connection_data = {
-            'login': int(Config.MT5_LOGIN),
-            'password': Config.MT5_PASSWORD,
-            'server': Config.MT5_SERVER,
-            'path': "",  # Empty path for default terminal location
-            'timeout': 10000  # 10 seconds timeout
-        }
+        log.info("Connecting to MetaTrader5 terminal (Server: %s)...", Config.MT5_SERVER)
         
         try:
             # Make the connection request with proper JSON payload
             result = self._make_request(
                 Config.ENDPOINTS['connect'], 
                 'POST', 
-                json=connection_data
+                json=self._connection_payload
             )
             
             # Check the response format
             if result.get('connected', False) and result.get('status') == 'success':
                 self.connected = True
-                print("✅ Successfully connected to MetaTrader5")
-                print(f"   Login: {result.get('login')}")
-                print(f"   Server: {result.get('server')}")
+                log.info("Successfully connected to MetaTrader5")
+                log.info("Login: %s", result.get('login'))
+                log.info("Server: %s", result.get('server'))
             else:
                 error = result.get('message', 'Unknown error')
-                print(f"❌ Failed to connect to MetaTrader5: {error}")
+                log.error("Failed to connect to MetaTrader5: %s", error)
                 self.connected = False
                 
         except Exception as e:
-            print(f"❌ Connection error: {str(e)}")
+            log.error("Connection error: %s", e)
             self.connected = False
             
         return self.connected
     
-    def get_ohlc(self, symbol: str, timeframe: str = 'D1', count: int = 1) -> List[dict]:
+    def get_ohlc(self, symbol: str, timeframe: str = 'D1', count: int = 1) -> np.ndarray:
         """
         Fetch OHLC data for a given symbol
         
@@ -220,11 +398,12 @@ class MetaSyncAPI:
             count: Number of candles to return
             
         Returns:
-            List of OHLC data points as dictionaries
+            Structured array of candles (fields: time, open, high, low, close,
+            volume) sorted oldest first, or an empty array on failure
         """
         if not self.connected and not self.connect():
-            print("❌ Error: Not connected to MetaTrader5")
-            return []
+            log.error("Not connected to MetaTrader5")
+            return np.empty(0, dtype=OHLC_DTYPE)
             
         try:
             # Calculate date range for the requested number of candles
@@ -243,35 +422,45 @@ class MetaSyncAPI:
                 'date_to': end_date.strftime('%Y-%m-%d %H:%M:%S')
             }
             
-            print(f"🔹 Fetching OHLC data for {symbol} ({timeframe}) from {start_date} to {end_date}")
+            log.debug("Fetching OHLC data for %s (%s) from %s to %s", symbol, timeframe, start_date, end_date)
             result = self._make_request(Config.ENDPOINTS['ohlc'], 'GET', **params)
             
-            # Ensure we return a list of candles
+            # Ensure we work on a list of candles
+            by_time = operator.itemgetter('time')
             if isinstance(result, list):
-                # Sort by time (oldest first) and take the last 'count' candles
-                result = sorted(result, key=lambda x: x.get('time', 0))[-count:]
-                print(f"  ✅ Retrieved {len(result)} candles for {symbol}")
-                return result
+                # Take the latest 'count' candles, sorted by time (oldest first)
+                result = sorted(heapq.nlargest(count, result, key=by_time), key=by_time)
+                log.debug("Retrieved %d candles for %s", len(result), symbol)
+                return self._candles_to_array(result)
             elif isinstance(result, dict):
                 if 'candles' in result:
                     candles = result['candles']
-                    candles = sorted(candles, key=lambda x: x.get('time', 0))[-count:]
-                    print(f"  ✅ Retrieved {len(candles)} candles for {symbol} from 'candles' key")
-                    return candles
+                    candles = sorted(heapq.nlargest(count, candles, key=by_time), key=by_time)
+                    log.debug("Retrieved %d candles for %s from 'candles' key", len(candles), symbol)
+                    return self._candles_to_array(candles)
                 elif 'message' in result:
-                    print(f"  ⚠️  API Error for {symbol}: {result.get('message')}")
+                    log.warning("API Error for %s: %s", symbol, result.get('message'))
             
-            print(f"  ⚠️  Unexpected OHLC response format for {symbol}")
-            return []
+            log.warning("Unexpected OHLC response format for %s", symbol)
+            return np.empty(0, dtype=OHLC_DTYPE)
                 
         except Exception as e:
-            print(f"❌ Error fetching OHLC data for {symbol}: {str(e)}")
-            return []
+            log.error("Error fetching OHLC data for %s: %s", symbol, e)
+            return np.empty(0, dtype=OHLC_DTYPE)
+    
+    @staticmethod
+    def _candles_to_array(candles: List[dict]) -> np.ndarray:
+        """Convert a list of candle dictionaries to a structured OHLC array"""
+        return np.array(
+            [(c['time'], c['open'], c['high'], c['low'], c['close'],
+              c.get('volume', c.get('tick_volume', 0))) for c in candles],
+            dtype=OHLC_DTYPE
+        )
     
     def get_tick(self, symbol: str) -> dict:
         """Get current tick data for a symbol"""
         if not self.connected and not self.connect():
-            print("Error: Not connected to MetaTrader5")
+            log.error("Not connected to MetaTrader5")
             return {}
             
         return self._make_request(Config.ENDPOINTS['tick'], 'GET', symbol=symbol)
@@ -279,7 +468,7 @@ class MetaSyncAPI:
     def get_account_info(self) -> dict:
         """Get account information"""
         if not self.connected and not self.connect():
-            print("Error: Not connected to MetaTrader5")
+            log.error("Not connected to MetaTrader5")
             return {}
             
         return self._make_request(Config.ENDPOINTS['account_info'], 'GET')
@@ -287,30 +476,12 @@ class MetaSyncAPI:
     def get_positions(self) -> List[dict]:
         """Get open positions"""
         if not self.connected and not self.connect():
-            print("Error: Not connected to MetaTrader5")
+            log.error("Not connected to MetaTrader5")
             return []
             
         result = self._make_request(Config.ENDPOINTS['positions'], 'GET')
         return result.get('positions', [])
     
-    @staticmethod
-    def get_account_info() -> dict:
-        """Fetch account information"""
-        url = f"https://{Config.RAPIDAPI_HOST}/get_account"
-        
-        headers = {
-            'X-RapidAPI-Key': Config.RAPIDAPI_KEY,
-            'X-RapidAPI-Host': Config.RAPIDAPI_HOST
-        }
-        
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            print(f"Error fetching account info: {e}")
-            return {}
-    
     def get_symbol_info(self, symbol: str) -> dict:
         """
         Fetch symbol information
@@ -322,17 +493,29 @@ class MetaSyncAPI:
             Dictionary containing symbol information or empty dict if not found
         """
         if not self.connected and not self.connect():
-            print("Error: Not connected to MetaTrader5")
+            log.error("Not connected to MetaTrader5")
             return {}
             
+        # Serve from cache while the entry is fresh
+        cached = self._symbol_info_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < Config.SYMBOL_INFO_TTL:
+            return cached[1]
+            
         # The API expects the symbol as a query parameter
-        return self._make_request(Config.ENDPOINTS['symbol_info'], 'GET', symbol=symbol)
+        result = self._make_request(Config.ENDPOINTS['symbol_info'], 'GET', symbol=symbol)
+        if result and not result.get('error'):
+            self._symbol_info_cache[symbol] = (time.monotonic(), result)
+        return result
     
     @staticmethod
     def get_open_positions() -> List[dict]:
         """Fetch current open positions"""
         # This is a placeholder - implement based on your broker's API
         return []
+    
+    def close(self):
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
 
 class SectorRotationStrategy:
     """ETF Sector Rotation Strategy Implementation"""
@@ -343,29 +526,198 @@ class SectorRotationStrategy:
         self.last_trade_time = None
         self.connected = False
         self.symbol_info = {}
+        self._prev_close_cache: Dict[str, Tuple[float, float]] = {}
+        
+        # Worker pool shared by every update cycle
+        self._executor = ThreadPoolExecutor(max_workers=Config.MAX_CONCURRENT_REQUESTS)
+        # Set on shutdown to cut short retry waits running on the pool
+        self._closing = threading.Event()
+    
+    def close(self):
+        """Release the worker pool and the API session"""
+        # Drop queued fetches; only requests already in flight are left to finish
+        self._closing.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.api.close()
     
     def initialize(self) -> bool:
         """Initialize the strategy and connect to the API"""
-        print("Initializing Sector Rotation Strategy...")
+        log.info("Initializing Sector Rotation Strategy...")
         self.connected = self.api.connect()
         
         if not self.connected:
-            print("❌ Failed to connect to MetaTrader5")
+            log.error("Failed to connect to MetaTrader5")
             return False
         
         # Load symbol information
-        self._load_symbol_info()
+        asyncio.run(self._load_symbol_info())
         return True
         
-    def _load_symbol_info(self) -> pd.DataFrame:
+    def _fetch_sector(self, sector_name: str, symbol: str) -> Optional[dict]:
         """
-        Load symbol information for all sectors and benchmark
+        Fetch symbol info, current price and daily change for a single sector
+        
+        Args:
+            sector_name: Display name of the sector
+            symbol: Symbol to fetch data for
+            
+        Returns:
+            Dictionary with the sector row, or None if the data is unavailable
+        """
+        try:
+            log.debug("Fetching info for %s (%s)...", sector_name, symbol)
+            
+            # Get symbol info
+            symbol_info = self.api.get_symbol_info(symbol)
+            if not symbol_info:
+                log.warning("No symbol info found for %s (%s)", sector_name, symbol)
+                return None
+            
+            log.debug("Successfully loaded %s (%s) info", sector_name, symbol)
+        except Exception as e:
+            log.error("Error processing %s: %s", sector_name, e)
+            return None
+        
+        quote = self._fetch_quote(sector_name, symbol)
+        if not quote:
+            return None
+        
+        return {
+            'sector': sector_name,
+            'symbol': symbol,
+            **quote
+        }
+    
+    def _fetch_quote(self, name: str, symbol: str) -> Optional[dict]:
+        """
+        Fetch the current price and daily change for a symbol
+        
+        Args:
+            name: Display name used in log messages
+            symbol: Symbol to fetch data for
+            
+        Returns:
+            Dictionary with price, change and volume, or None if the data is unavailable
+        """
+        try:
+            # Get tick data (current price)
+            log.debug("Fetching tick data...")
+            tick_data = self.api.get_tick(symbol)
+            
+            if not tick_data or 'bid' not in tick_data or 'ask' not in tick_data:
+                log.warning("No valid tick data for %s (%s)", name, symbol)
+                return None
+            
+            # Calculate mid price
+            current_price = (tick_data['bid'] + tick_data['ask']) / 2
+            
+            # Get previous close for daily change calculation
+            prev_close = self._get_prev_close(name, symbol, tick_data.get('time'))
+            
+            daily_change = 0.0
+            if prev_close and prev_close > 0:  # Avoid division by zero
+                # Calculate daily change from previous close to current price
+                daily_change = ((current_price - prev_close) / prev_close) * 100
+            
+            log.debug("Successfully processed %s data", name)
+            return {
+                'price': current_price,
+                'change': daily_change,
+                'volume': tick_data.get('volume', 0)
+            }
+            
+        except Exception as e:
+            log.error("Error processing %s: %s", name, e)
+            return None
+    
+    def _get_prev_close(self, sector_name: str, symbol: str, tick_time: Any) -> Optional[float]:
+        """
+        Get the previous daily close for a symbol
+        
+        The previous close only changes when a new daily bar opens, so it is
+        cached until the tick time moves past the end of the current bar.
+        
+        Args:
+            sector_name: Display name of the sector
+            symbol: Symbol to fetch data for
+            tick_time: Server time of the latest tick (epoch seconds), if known
+            
+        Returns:
+            Previous close price, or None if it could not be fetched
+        """
+        has_tick_time = isinstance(tick_time, (int, float))
+        cached = self._prev_close_cache.get(symbol)
+        if cached and has_tick_time and cached[0] <= tick_time < cached[0] + 86400:
+            return cached[1]
         
+        # Get OHLC data for the previous and current daily bars
+        log.debug("Fetching OHLC data for %s (%s)...", sector_name, symbol)
+        ohlc_data = self.api.get_ohlc(symbol, 'D1', 2)  # Get last 2 days
+        if len(ohlc_data) < 2:
+            return None
+        
+        prev_close = float(ohlc_data['close'][0])
+        self._prev_close_cache[symbol] = (int(ohlc_data['time'][-1]), prev_close)
+        return prev_close
+    
+    def _fetch_benchmark(self, ts: str, deadline: Optional[float] = None) -> dict:
+        """
+        Fetch current price and daily change for the benchmark
+        
+        Transient failures are retried with exponential backoff and jitter, so a
+        short network blip does not cost a whole update cycle.
+        
+        Args:
+            ts: Timestamp of this update cycle
+            deadline: time.monotonic() value after which no new attempt is started
+                (defaults to no limit)
+            
         Returns:
-            DataFrame containing sector information with prices and returns
+            Dictionary containing benchmark data, or empty dict if unavailable
         """
-        sector_data = []
+        for attempt in range(Config.BENCHMARK_ATTEMPTS):
+            # The benchmark only needs a quote; its symbol info is never used
+            row = self._fetch_quote('Benchmark', Config.BENCHMARK)
+            if row or attempt == Config.BENCHMARK_ATTEMPTS - 1:
+                break
+            
+            delay = min(2 ** attempt + random.random(), Config.BENCHMARK_MAX_BACKOFF)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                log.warning("Benchmark fetch failed. No time left to retry this cycle")
+                break
+            
+            log.warning("Benchmark fetch failed. Retrying in %.1f seconds...", delay)
+            # Wakes early when the strategy is closed
+            if self._closing.wait(delay):
+                break
+        
+        if not row:
+            return {}
         
+        return {
+            'symbol': Config.BENCHMARK,
+            'price': row['price'],
+            'change': row['change'],
+            'timestamp': ts
+        }
+    
+    async def _load_symbol_info(self, ts: Optional[str] = None,
+                                benchmark_timeout: Optional[float] = None) -> Tuple[SectorSnapshot, dict]:
+        """
+        Load symbol information for all sectors and benchmark
+        
+        The fetches run on the shared worker pool and are awaited individually,
+        so cancelling the caller drops every fetch that has not started yet.
+        
+        Args:
+            ts: Timestamp of this update cycle (defaults to now)
+            benchmark_timeout: Seconds from the start of the fetch to wait for the benchmark,
+                retries included (defaults to no limit)
+            
+        Returns:
+            Tuple of (SectorSnapshot containing sector information with prices
+            and returns, benchmark data dictionary or empty dict if unavailable)
+        """
         # Define sector symbols with their full exchange names
         sector_symbols = {
             'Financials': 'XLF.NYSE',
@@ -377,215 +729,182 @@ class SectorRotationStrategy:
             'Technology': 'USTEC'  # NASDAQ-100 as tech proxy (no .NASDAQ suffix needed)
         }
         
-        print("Loading symbol information...")
+        log.info("Loading symbol information...")
+        ts = ts or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        for sector_name, symbol in sector_symbols.items():
-            try:
-                print(f"🔹 Fetching info for {sector_name} ({symbol})...")
-                full_symbol = symbol
-                
-                # Get symbol info
-                symbol_info = self.api.get_symbol_info(full_symbol)
-                if not symbol_info:
-                    print(f"  ❌ No symbol info found for {sector_name} ({full_symbol})")
-                    continue
-                
-                print(f"  ✅ Successfully loaded {sector_name} ({full_symbol}) info")
-                
-                # Get tick data (current price)
-                print(f"  🔄 Fetching tick data...")
-                tick_data = self.api.get_tick(full_symbol)
-                
-                if not tick_data or 'bid' not in tick_data or 'ask' not in tick_data:
-                    print(f"  ❌ No valid tick data for {sector_name} ({full_symbol})")
-                    continue
-                
-                # Calculate mid price
-                current_price = (tick_data['bid'] + tick_data['ask']) / 2
-                
-                # Get OHLC data for daily change calculation
-                print(f"  🔄 Fetching OHLC data for {sector_name} ({full_symbol})...")
-                ohlc_data = self.api.get_ohlc(full_symbol, 'D1', 2)  # Get last 2 days
-                
-                daily_change = 0.0
-                if ohlc_data and len(ohlc_data) >= 2:
-                    # Calculate daily change from previous close to current price
-                    prev_close = ohlc_data[0]['close']
-                    if prev_close > 0:  # Avoid division by zero
-                        daily_change = ((current_price - prev_close) / prev_close) * 100
-                
-                # Add to sector data
-                sector_data.append({
-                    'sector': sector_name,
-                    'symbol': full_symbol,
-                    'price': current_price,
-                    'change': daily_change,
-                    'volume': tick_data.get('volume', 0),
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-                
-                print(f"  ✅ Successfully processed {sector_name} data")
-                time.sleep(0.5)  # Add delay between API calls
-                
-            except Exception as e:
-                print(f"❌ Error processing {sector_name}: {str(e)}")
+        # Preallocate one slot per sector
+        n = len(sector_symbols)
+        sectors = np.empty(n, dtype=object)
+        symbols = np.empty(n, dtype=object)
+        prices = np.empty(n, dtype=np.float64)
+        changes = np.empty(n, dtype=np.float64)
+        volumes = np.empty(n, dtype=np.float64)
+        
+        # Fetch all sectors and the benchmark concurrently; results keep the sector order
+        # The benchmark stops retrying at the same deadline the wait below gives up at
+        deadline = None
+        if benchmark_timeout is not None:
+            deadline = time.monotonic() + benchmark_timeout
+        benchmark_future = self._executor.submit(self._fetch_benchmark, ts, deadline)
+        futures = [self._executor.submit(self._fetch_sector, sector_name, symbol)
+                   for sector_name, symbol in sector_symbols.items()]
         
-        # Convert to DataFrame if we have data, otherwise return empty DataFrame
-        if sector_data:
-            return pd.DataFrame(sector_data)
-        return pd.DataFrame()
+        rows = await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+        
+        count = 0
+        for row in rows:
+            if not row:
+                continue
+            sectors[count] = row['sector']
+            symbols[count] = row['symbol']
+            prices[count] = row['price']
+            changes[count] = row['change']
+            volumes[count] = row['volume']
+            count += 1
         
-        # Fetch benchmark data
-        benchmark_data = {}
         try:
-            # Get benchmark tick data (US500 for S&P 500)
-            benchmark_tick = self.api.get_tick(Config.BENCHMARK)
-            
-            # Get OHLC data for the benchmark
-            benchmark_ohlc = self.api.get_ohlc(Config.BENCHMARK, 'D1', 2)
-            
-            if benchmark_tick and 'last' in benchmark_tick:
-                # Calculate daily return for benchmark
-                benchmark_change = 0.0
-                if benchmark_ohlc and len(benchmark_ohlc) >= 2:
-                    prev_close = benchmark_ohlc[1].get('close')
-                    current_price = benchmark_tick['last']
-                    if prev_close and prev_close != 0:
-                        benchmark_change = (current_price - prev_close) / prev_close * 100
-                
-                benchmark_data = {
-                    'price': benchmark_tick['last'],
-                    'change': benchmark_change,
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-        except Exception as e:
-            print(f"Error fetching benchmark data: {str(e)}")
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            benchmark_data = await asyncio.wait_for(asyncio.wrap_future(benchmark_future), remaining)
+        except asyncio.TimeoutError:
+            log.warning("Benchmark fetch for %s timed out after %.1f seconds", Config.BENCHMARK, benchmark_timeout)
+            benchmark_data = {}
         
-        return df_sectors.T, benchmark_data
+        # Trim unused slots (sectors whose data could not be fetched)
+        snapshot = SectorSnapshot(
+            sectors=sectors[:count],
+            symbols=symbols[:count],
+            prices=prices[:count],
+            changes=changes[:count],
+            volumes=volumes[:count],
+            timestamp=ts
+        )
+        return snapshot, benchmark_data
     
-    def calculate_relative_strength(self, sector_data: pd.DataFrame, benchmark_data: dict) -> pd.DataFrame:
+    def calculate_relative_strength(self, sector_data: SectorSnapshot, benchmark_data: dict) -> SectorSnapshot:
         """
         Calculate relative strength of sectors compared to benchmark
         
         Args:
-            sector_data: DataFrame containing sector data with 'change' column
+            sector_data: SectorSnapshot containing the daily change per sector
             benchmark_data: Dictionary containing benchmark data with 'change' key
             
         Returns:
-            DataFrame with added 'relative_strength' column
+            SectorSnapshot with 'rel_strength' and 'signals' populated
         """
         if sector_data.empty or not benchmark_data:
             return sector_data
         
-        # We already have the daily change percentage in the 'change' column
-        # Calculate relative strength vs benchmark
-        benchmark_change = benchmark_data.get('change', 0)
-        sector_data['relative_strength'] = sector_data['change'] - benchmark_change
+        # We already have the daily change percentage in 'changes'
+        # Calculate relative strength vs benchmark and classify signals
+        benchmark_change = float(benchmark_data.get('change', 0))
+        sector_data.rel_strength, sector_data.signals = compute_signals(
+            sector_data.changes, benchmark_change
+        )
         
         return sector_data
     
-    def display_dashboard(self, sector_data: pd.DataFrame, benchmark_data: dict):
+    def display_dashboard(self, sector_data: SectorSnapshot, benchmark_data: dict,
+                          ts: Optional[str] = None):
         """
         Display the sector rotation dashboard
         
         Args:
-            sector_data: DataFrame containing sector data
+            sector_data: SectorSnapshot containing sector data
             benchmark_data: Dictionary containing benchmark data
+            ts: Timestamp to show in the header (defaults to the snapshot's timestamp)
         """
         if sector_data.empty:
-            print("No sector data available to display.")
+            log.warning("No sector data available to display.")
             return
         
-        # Ensure we have the required columns
-        if 'relative_strength' not in sector_data.columns:
-            print("Warning: Relative strength data not available.")
+        # Ensure relative strength has been calculated
+        if sector_data.rel_strength is None:
+            log.warning("Relative strength data not available.")
             return
         
-        # Sort by relative strength
-        df_sorted = sector_data.sort_values('relative_strength', ascending=False)
+        # Sort by relative strength (strongest first)
+        order = np.argsort(-sector_data.rel_strength, kind='stable')
         
-        # Print dashboard header
-        print("\n" + "="*100)
-        print(f"SECTOR ROTATION DASHBOARD - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("-"*100)
+        # Reorder each array once
+        sectors = sector_data.sectors[order]
+        symbols = sector_data.symbols[order]
+        prices = sector_data.prices[order]
+        changes = sector_data.changes[order]
+        rel_strength = sector_data.rel_strength[order]
+        
+        # Map signal codes to labels with a table lookup
+        signals = SIGNAL_LABELS[sector_data.signals[order]]
         
-        # Display benchmark info
         benchmark_price = benchmark_data.get('price', 'N/A')
         benchmark_change = benchmark_data.get('change', 0)
-        print(f"{Config.BENCHMARK}: {benchmark_price} "
-              f"({benchmark_change:+.2f}% daily change)")
-        print("="*100)
-        
-        # Print sector performance table
-        print(f"{'Sector':<18} {'Symbol':<12} {'Price':<12} {'Daily %':<12} "
-              f"{'Rel Strength':<15} {'Signal'}")
-        print("-"*100)
-        
-        for _, row in df_sorted.iterrows():
-            # Get values with defaults to handle any missing data
-            sector = row.get('sector', 'N/A')
-            symbol = row.get('symbol', 'N/A')
-            price = row.get('price', 0)
-            change = row.get('change', 0)
-            rel_strength = row.get('relative_strength', 0)
-            
-            # Determine signal strength
-            if rel_strength > 1.0:
-                signal = "🟢 STRONG"
-            elif rel_strength > 0.5:
-                signal = "🟡 NEUTRAL"
-            else:
-                signal = "🔴 WEAK"
-            
-            # Format the output
-            print(f"{sector:<18} {symbol:<12} {price:<12.2f} "
-                  f"{change:>+8.2f}%    "
-                  f"{rel_strength:>+8.2f}%     {signal}")
         
-        print("="*100)
-        print("""Legend: 🟢 STRONG (Relative Strength > 1.0%) | """
-              """🟡 NEUTRAL (0.5% < RS ≤ 1.0%) | 🔴 WEAK (RS ≤ 0.5%)""")
+        # Let queued log records reach stdout first so they stay in order with the dashboard
+        if _log_queue is not None:
+            _log_queue.join()
+        
+        # Build the whole dashboard and write it in one go
+        lines = [
+            "",
+            "="*100,
+            f"SECTOR ROTATION DASHBOARD - {ts or sector_data.timestamp}",
+            "-"*100,
+            f"{Config.BENCHMARK}: {benchmark_price} ({benchmark_change:+.2f}% daily change)",
+            "="*100,
+            f"{'Sector':<18} {'Symbol':<12} {'Price':<12} {'Daily %':<12} "
+            f"{'Rel Strength':<15} {'Signal'}",
+            "-"*100,
+        ]
+        lines.extend(
+            f"{sector:<18} {symbol:<12} {price:<12.2f} "
+            f"{change:>+8.2f}%    "
+            f"{rs:>+8.2f}%     {signal}"
+            for sector, symbol, price, change, rs, signal
+            in zip(sectors, symbols, prices, changes, rel_strength, signals)
+        )
+        lines.append("="*100)
+        lines.append("Legend: 🟢 STRONG (Relative Strength > 1.0%) | "
+                     "🟡 NEUTRAL (0.5% < RS ≤ 1.0%) | 🔴 WEAK (RS ≤ 0.5%)")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
-    def run_strategy(self, update_interval: int = 300):
+    async def run_strategy(self, update_interval: int = 300):
         """
         Main method to run the sector rotation strategy
         
+        Updates start every update_interval seconds; the time spent fetching
+        data is subtracted from the wait instead of added to it.
+        
         Args:
             update_interval: Time between updates in seconds (default: 300s = 5 minutes)
         """
         if not self.connected:
-            print("❌ Not connected to MetaTrader5. Please initialize the strategy first.")
+            log.error("Not connected to MetaTrader5. Please initialize the strategy first.")
             return
         
-        print("🚀 Starting ETF Sector Rotation Strategy...")
-        print("Press Ctrl+C to stop monitoring\n")
+        log.info("Starting ETF Sector Rotation Strategy...")
+        log.info("Press Ctrl+C to stop monitoring")
         
         try:
             while True:
-                # Fetch and process data
-                sector_data = self._load_symbol_info()
+                cycle_start = time.perf_counter()
+                
+                # One timestamp for everything fetched in this cycle
+                ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                
+                # Fetch sector and benchmark data in one concurrent batch on the worker pool
+                sector_data, benchmark_data = await self._load_symbol_info(ts=ts, benchmark_timeout=update_interval)
                 
-                # Get benchmark data
                 try:
-                    benchmark_tick = self.api.get_tick(Config.BENCHMARK)
-                    if benchmark_tick and 'bid' in benchmark_tick and 'ask' in benchmark_tick:
-                        self.benchmark_price = (benchmark_tick['bid'] + benchmark_tick['ask']) / 2
-                        benchmark_change = 0  # You might want to calculate this based on previous price
-                        
-                        # Prepare benchmark data
-                        benchmark_data = {
-                            'symbol': Config.BENCHMARK,
-                            'price': self.benchmark_price,
-                            'change': benchmark_change,
-                            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
+                    if benchmark_data:
+                        self.benchmark_price = benchmark_data['price']
                         
                         if not sector_data.empty:
                             # Calculate metrics
                             sector_data = self.calculate_relative_strength(sector_data, benchmark_data)
                             
                             # Display dashboard
-                            self.display_dashboard(sector_data, benchmark_data)
+                            self.display_dashboard(sector_data, benchmark_data, ts=ts)
                             
                             # Generate trading signals (to be implemented)
                             # signals = self.generate_signals(sector_data)
@@ -594,230 +913,345 @@ class SectorRotationStrategy:
                             # if self.should_trade():
                             #     self.execute_trades(signals)
                     else:
-                        print(f"❌ Could not fetch benchmark data for {Config.BENCHMARK}")
+                        log.error("Could not fetch benchmark data for %s", Config.BENCHMARK)
                 except Exception as e:
-                    print(f"❌ Error fetching benchmark data: {str(e)}")
+                    log.error("Error processing sector data: %s", e)
                 
-                # Wait for the next update
-                print(f"\n🔄 Next update in {update_interval} seconds...")
-                time.sleep(update_interval)
+                # Wait for the next update, minus the time this cycle took
+                delay = max(0.0, update_interval - (time.perf_counter() - cycle_start))
+                log.info("Next update in %.0f seconds...", delay)
+                await asyncio.sleep(delay)
                     
-        except KeyboardInterrupt:
-            print("\n🛑 Strategy monitoring stopped by user.")
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            log.info("Strategy monitoring stopped by user.")
+            # Drop queued fetches so shutdown only waits for requests already in flight
+            self._closing.set()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            raise
         except Exception as e:
-            print(f"\n❌ Error in strategy execution: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in strategy execution: %s", e)
     
-    def calculate_relative_strength(self, sector_data: pd.DataFrame, benchmark_data: dict) -> pd.DataFrame:
-        """
-        Calculate relative strength of sectors compared to benchmark
+class Trade(NamedTuple):
+    """A completed trade; a timestamp_ns of 0 means 'stamp it when recorded'"""
+    symbol: str = ''
+    profit: float = 0.0
+    timestamp_ns: int = 0
+
+
+class PerformanceTracker:
+    """Tracks and analyzes strategy performance"""
+    
+    # Trade dict keys stored in dedicated columns; any other keys are kept as extra fields
+    # ('timestamp' is always set by the tracker)
+    _CORE_FIELDS = frozenset(('symbol', 'profit', 'timestamp', 'timestamp_ns'))
+    
+    def __init__(self):
+        self.daily_performance = []
         
-        Args:
-            sector_data: DataFrame containing sector data with 'change' column
-            benchmark_data: Dictionary containing benchmark data with 'change' key
-            
-        Returns:
-            DataFrame with added 'relative_strength' column
-        """
-        if sector_data.empty or not benchmark_data:
-            return sector_data
+        # Last TRADE_HISTORY_CAP trades stored column-wise; numeric columns live in the rings below
+        self._col_symbol = deque(maxlen=Config.TRADE_HISTORY_CAP)
+        self._col_extra = deque(maxlen=Config.TRADE_HISTORY_CAP)  # dict of extra fields, or None
         
-        # We already have the daily change percentage in the 'change' column
-        # Calculate relative strength vs benchmark
-        benchmark_change = benchmark_data.get('change', 0)
-        sector_data['relative_strength'] = sector_data['change'] - benchmark_change
+        # Trade profits and epoch timestamps (ns) as fixed-size rings; trade i is stored at slot i % capacity
+        self._profits_buf = np.empty(Config.TRADE_HISTORY_CAP, dtype=np.float64)
+        self._ts_buf = np.empty(Config.TRADE_HISTORY_CAP, dtype=np.int64)
+        self._profits_len = 0
         
-        return sector_data
+        # Running aggregates over the first '_folded' trades (all-time, not just the ring)
+        self._folded = 0
+        self._n_win = 0
+        self._n_loss = 0
+        # Kahan-compensated sums, laid out as _metrics_kernel expects
+        self._acc = np.zeros(4, dtype=np.float64)
     
-    def display_dashboard(self, sector_data: pd.DataFrame, benchmark_data: dict):
+    def record_trade(self, trade_data: Union[Trade, dict]):
+        """Record a completed trade (timestamps are formatted on export, not here)"""
+        symbol, profit, ts_ns, extra = self._unpack_trade(trade_data)
+        
+        n = self._profits_len
+        capacity = len(self._profits_buf)
+        if n - self._folded == capacity:
+            # The oldest slot has not been aggregated yet; fold before overwriting it
+            self._fold_pending()
+        
+        slot = n % capacity
+        self._profits_buf[slot] = profit
+        self._ts_buf[slot] = ts_ns or time.time_ns()
+        self._col_symbol.append(symbol)
+        self._col_extra.append(extra)
+        self._profits_len = n + 1
+    
+    def _unpack_trade(self, trade_data: Union[Trade, dict]) -> Tuple[str, float, int, Optional[dict]]:
+        """Split a trade into (symbol, profit, timestamp_ns, extra fields or None)"""
+        if isinstance(trade_data, Trade):
+            return trade_data.symbol, trade_data.profit, trade_data.timestamp_ns, None
+        
+        extra = {k: v for k, v in trade_data.items() if k not in self._CORE_FIELDS} or None
+        return (trade_data.get('symbol', ''), trade_data.get('profit', 0),
+                trade_data.get('timestamp_ns', 0), extra)
+    
+    def record_trades(self, batch: Union[List[Union[Trade, dict]], 'pa.Table']):
         """
-        Display the sector rotation dashboard
+        Record many completed trades at once
         
         Args:
-            sector_data: DataFrame containing sector data
-            benchmark_data: Dictionary containing benchmark data
+            batch: List of Trade tuples and/or trade dictionaries, or a pyarrow Table with
+                a 'profit' column (and optionally 'symbol' and 'timestamp_ns')
         """
-        if sector_data.empty:
-            print("No sector data available to display.")
+        stamps = None
+        if pa is not None and isinstance(batch, pa.Table):
+            # Arrow hands out read-only buffers; copy into writable arrays
+            profits = np.array(batch.column('profit').fill_null(0).to_numpy(), dtype=np.float64)
+            if 'symbol' in batch.column_names:
+                symbols = batch.column('symbol').to_pylist()
+            else:
+                symbols = [''] * len(profits)
+            if 'timestamp_ns' in batch.column_names:
+                stamps = np.array(batch.column('timestamp_ns').fill_null(0).to_numpy(), dtype=np.int64)
+            other_columns = [c for c in batch.column_names if c not in self._CORE_FIELDS]
+            if other_columns:
+                extras = batch.select(other_columns).to_pylist()
+            else:
+                extras = [None] * len(profits)
+        elif not batch:
             return
+        elif all(isinstance(t, Trade) for t in batch):
+            symbols, profit_col, ts_col = zip(*batch)
+            symbols = list(symbols)
+            profits = np.array(profit_col, dtype=np.float64)
+            stamps = np.array(ts_col, dtype=np.int64)
+            extras = [None] * len(profits)
+        else:
+            symbols, profit_col, ts_col, extras = zip(*(self._unpack_trade(t) for t in batch))
+            symbols = list(symbols)
+            profits = np.array(profit_col, dtype=np.float64)
+            stamps = np.array(ts_col, dtype=np.int64)
         
-        # Ensure we have the required columns
-        if 'relative_strength' not in sector_data.columns:
-            print("Warning: Relative strength data not available.")
+        if not len(profits):
             return
         
-        # Sort by relative strength
-        df_sorted = sector_data.sort_values('relative_strength', ascending=False)
+        # Aggregate the whole batch directly; only the newest trades need to fit in the ring
+        self._fold_pending()
+        self._accumulate(profits)
         
-        # Print dashboard header
-        print("\n" + "="*100)
-        print(f"SECTOR ROTATION DASHBOARD - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("-"*100)
+        now = time.time_ns()
+        if stamps is None:
+            stamps = np.full(len(profits), now, dtype=np.int64)
+        else:
+            stamps[stamps == 0] = now
         
-        # Display benchmark info
-        benchmark_price = benchmark_data.get('price', 'N/A')
-        benchmark_change = benchmark_data.get('change', 0)
-        print(f"{Config.BENCHMARK}: {benchmark_price} "
-              f"({benchmark_change:+.2f}% daily change)")
-        print("="*100)
-        
-        # Print sector performance table
-        print(f"{'Sector':<18} {'Symbol':<12} {'Price':<12} {'Daily %':<12} "
-              f"{'Rel Strength':<15} {'Signal'}")
-        print("-"*100)
-        
-        for _, row in df_sorted.iterrows():
-            # Get values with defaults to handle any missing data
-            sector = row.get('sector', 'N/A')
-            symbol = row.get('symbol', 'N/A')
-            price = row.get('price', 0)
-            change = row.get('change', 0)
-            rel_strength = row.get('relative_strength', 0)
-            
-            # Determine signal strength
-            if rel_strength > 1.0:
-                signal = "🟢 STRONG"
-            elif rel_strength > 0.5:
-                signal = "🟡 NEUTRAL"
-            else:
-                signal = "🔴 WEAK"
-            
-            # Format the output
-            print(f"{sector:<18} {symbol:<12} {price:<12.2f} "
-                  f"{change:>+8.2f}%    "
-                  f"{rel_strength:>+8.2f}%     {signal}")
+        n = self._profits_len + len(profits)
+        keep = min(len(profits), len(self._profits_buf))
+        for buf, values in ((self._profits_buf, profits), (self._ts_buf, stamps)):
+            tail = values[len(values) - keep:]
+            offset = 0
+            for view in self._ring_slices(n - keep, keep, buf):
+                view[:] = tail[offset:offset + len(view)]
+                offset += len(view)
+        self._col_symbol.extend(symbols)
+        self._col_extra.extend(extras)
         
-        print("="*100)
-        print("""Legend: 🟢 STRONG (Relative Strength > 1.0%) | """
-              """🟡 NEUTRAL (0.5% < RS ≤ 1.0%) | 🔴 WEAK (RS ≤ 0.5%)""")
+        self._profits_len = n
+        self._folded = n
     
-    def run_strategy(self, update_interval: int = 300):
+    def _ring_slices(self, start: int, count: int, buf: Optional[np.ndarray] = None) -> List[np.ndarray]:
+        """Views over 'count' entries of a ring (profits by default) beginning at trade 'start', in recording order"""
+        if buf is None:
+            buf = self._profits_buf
+        capacity = len(buf)
+        begin = start % capacity
+        end = begin + count
+        if end <= capacity:
+            return [buf[begin:end]]
+        return [buf[begin:], buf[:end - capacity]]
+    
+    def _retained_index(self, i: int) -> int:
+        """Normalize a position among the retained trades (negative counts from the newest)"""
+        retained = len(self._col_symbol)
+        if not -retained <= i < retained:
+            raise IndexError("trade index out of range")
+        return i + retained if i < 0 else i
+    
+    def trade(self, i: int) -> Trade:
         """
-        Main method to run the sector rotation strategy
+        Return a retained trade
         
         Args:
-            update_interval: Time between updates in seconds (default: 300s = 5 minutes)
+            i: Position among the retained trades, oldest first (negative counts from the newest)
+            
+        Returns:
+            The trade as a Trade tuple
         """
-        if not self.connected:
-            print("❌ Not connected to MetaTrader5. Please initialize the strategy first.")
-            return
+        i = self._retained_index(i)
+        slot = (self._profits_len - len(self._col_symbol) + i) % len(self._profits_buf)
+        return Trade(self._col_symbol[i], float(self._profits_buf[slot]), int(self._ts_buf[slot]))
+    
+    def iso_timestamp(self, i: int) -> str:
+        """
+        Format the timestamp of a retained trade as an ISO string
         
-        print("🚀 Starting ETF Sector Rotation Strategy...")
-        print("Press Ctrl+C to stop monitoring\n")
+        Args:
+            i: Position among the retained trades, oldest first (negative counts from the newest)
+            
+        Returns:
+            ISO 8601 timestamp in local time
+        """
+        return datetime.fromtimestamp(self.trade(i).timestamp_ns / 1e9).isoformat()
+    
+    @property
+    def trade_history(self) -> List[dict]:
+        """
+        Retained trades as dictionaries, oldest first
         
-        try:
-            while True:
-                # Fetch and process data
-                sector_data = self._load_symbol_info()
-                
-                # Get benchmark data
-                try:
-                    benchmark_tick = self.api.get_tick(Config.BENCHMARK)
-                    if benchmark_tick and 'bid' in benchmark_tick and 'ask' in benchmark_tick:
-                        self.benchmark_price = (benchmark_tick['bid'] + benchmark_tick['ask']) / 2
-                        benchmark_change = 0  # You might want to calculate this based on previous price
-                        
-                        # Prepare benchmark data
-                        benchmark_data = {
-                            'symbol': Config.BENCHMARK,
-                            'price': self.benchmark_price,
-                            'change': benchmark_change,
-                            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
-                        
-                        if not sector_data.empty:
-                            # Calculate metrics
-                            sector_data = self.calculate_relative_strength(sector_data, benchmark_data)
-                            
-                            # Display dashboard
-                            self.display_dashboard(sector_data, benchmark_data)
-                            
-                            # Generate trading signals (to be implemented)
-                            # signals = self.generate_signals(sector_data)
-                            # 
-                            # # Execute trades (to be implemented)
-                            # if self.should_trade():
-                            #     self.execute_trades(signals)
-                    else:
-                        print(f"❌ Could not fetch benchmark data for {Config.BENCHMARK}")
-                except Exception as e:
-                    print(f"❌ Error fetching benchmark data: {str(e)}")
-                
-                # Wait for the next update
-                print(f"\n🔄 Next update in {update_interval} seconds...")
-                time.sleep(update_interval)
-                    
-        except KeyboardInterrupt:
-            print("\n🛑 Strategy monitoring stopped by user.")
-        except Exception as e:
-            print(f"\n❌ Error in strategy execution: {str(e)}")
-            import traceback
-            traceback.print_exc()
+        Each entry holds the fields the trade was recorded with, plus an ISO 'timestamp'.
+        Only the last TRADE_HISTORY_CAP trades are retained.
+        """
+        retained = len(self._col_symbol)
+        first = self._profits_len - retained
+        profits = np.concatenate(self._ring_slices(first, retained)).tolist()
+        stamps = np.concatenate(self._ring_slices(first, retained, self._ts_buf)).tolist()
+        return [
+            {**(extra or {}), 'symbol': symbol, 'profit': profit,
+             'timestamp': datetime.fromtimestamp(ns / 1e9).isoformat()}
+            for symbol, profit, ns, extra in zip(self._col_symbol, profits, stamps, self._col_extra)
+        ]
     
-class PerformanceTracker:
-    """Tracks and analyzes strategy performance"""
+    def as_table(self):
+        """
+        Return the trade history as a pyarrow Table
+        
+        Returns:
+            Table with symbol, timestamp (ISO), timestamp_ns and profit columns for the retained trades
+        """
+        if pa is None:
+            raise RuntimeError("pyarrow is required for as_table(); install it with 'pip install pyarrow'")
+        
+        retained = len(self._col_symbol)
+        first = self._profits_len - retained
+        profits = np.concatenate(self._ring_slices(first, retained))
+        stamps = np.concatenate(self._ring_slices(first, retained, self._ts_buf))
+        return pa.table({
+            'symbol': pa.array(list(self._col_symbol), type=pa.string()),
+            'timestamp': pa.array([datetime.fromtimestamp(ns / 1e9).isoformat() for ns in stamps.tolist()], type=pa.string()),
+            'timestamp_ns': pa.array(stamps),
+            'profit': pa.array(profits),
+        })
     
-    def __init__(self):
-        self.trade_history = []
-        self.daily_performance = []
+    def _fold_pending(self):
+        """Add profits recorded since the last fold to the running aggregates"""
+        if self._folded == self._profits_len:
+            return
+        
+        for chunk in self._ring_slices(self._folded, self._profits_len - self._folded):
+            self._accumulate(chunk)
+        self._folded = self._profits_len
     
-    def record_trade(self, trade_data: dict):
-        """Record a completed trade"""
-        self.trade_history.append({
-            **trade_data,
-            'timestamp': datetime.now().isoformat()
-        })
+    def _accumulate(self, profits: np.ndarray):
+        """Add a contiguous block of profits to the running aggregates"""
+        n_win, n_loss = _metrics_kernel(profits, self._acc)
+        self._n_win += n_win
+        self._n_loss += n_loss
     
     def calculate_performance_metrics(self) -> dict:
-        """Calculate key performance metrics"""
-        if not self.trade_history:
+        """Calculate key performance metrics (only new trades are aggregated)"""
+        if not self._profits_len:
             return {}
         
-        total_trades = len(self.trade_history)
-        winning_trades = [t for t in self.trade_history if t.get('profit', 0) > 0]
-        losing_trades = [t for t in self.trade_history if t.get('profit', 0) <= 0]
+        self._fold_pending()
+        n_win = self._n_win
+        n_loss = self._n_loss
         
-        win_rate = (len(winning_trades) / total_trades * 100) if total_trades > 0 else 0
+        total_trades = n_win + n_loss
+        win_rate = n_win / total_trades * 100
         
-        total_profit = sum(t.get('profit', 0) for t in self.trade_history)
-        avg_win = (sum(t.get('profit', 0) for t in winning_trades) / 
-                  len(winning_trades)) if winning_trades else 0
-        avg_loss = (sum(t.get('profit', 0) for t in losing_trades) / 
-                   len(losing_trades)) if losing_trades else 0
+        # Apply the outstanding compensation terms
+        sum_win_hi, c_win, sum_loss_hi, c_loss = self._acc.tolist()
+        sum_win = sum_win_hi - c_win
+        sum_loss = sum_loss_hi - c_loss
+        
+        avg_win = sum_win / n_win if n_win else 0
+        avg_loss = sum_loss / n_loss if n_loss else 0
         
         return {
             'total_trades': total_trades,
             'win_rate': win_rate,
-            'total_profit': total_profit,
+            'total_profit': math.fsum((sum_win_hi, -c_win, sum_loss_hi, -c_loss)),
             'avg_win': avg_win,
             'avg_loss': avg_loss,
-            'profit_factor': abs(avg_win / avg_loss) if avg_loss != 0 else float('inf')
+            # Gross profit over gross loss; losses are never positive, so negate rather than abs()
+            'profit_factor': sum_win / -sum_loss if sum_loss < 0 else float('inf')
         }
 
 
+class _ConsoleFormatter(logging.Formatter):
+    """Formats records as plain messages, marking warnings and errors"""
+    
+    MARKERS = {logging.WARNING: "⚠️  ", logging.ERROR: "❌ ", logging.CRITICAL: "❌ "}
+    
+    def format(self, record: logging.LogRecord) -> str:
+        return self.MARKERS.get(record.levelno, "") + super().format(record)
+
+
+def _start_logging() -> logging.handlers.QueueListener:
+    """
+    Send log records through a queue so console output is written on a background thread
+    
+    Returns:
+        The started listener; pass it to _stop_logging() to flush pending records
+    """
+    global _log_queue
+    _log_queue = queue.Queue()
+    
+    # Same stream as the dashboard, so output is not split across stdout and stderr
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_ConsoleFormatter("%(message)s"))
+    listener = logging.handlers.QueueListener(_log_queue, handler)
+    
+    root = logging.getLogger()
+    root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+    root.addHandler(logging.handlers.QueueHandler(_log_queue))
+    listener.start()
+    return listener
+
+
+def _stop_logging(listener: logging.handlers.QueueListener):
+    """Flush pending log records and detach the queue from the root logger"""
+    global _log_queue
+    listener.stop()
+    
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is _log_queue:
+            root.removeHandler(handler)
+    _log_queue = None
+
+
 def main():
     """Main entry point for the script"""
+    listener = _start_logging()
+    
+    strategy = None
     try:
         # Initialize and run the strategy
         strategy = SectorRotationStrategy()
         
         # First, try to connect to MT5
         if not strategy.initialize():
-            print("❌ Failed to initialize strategy. Please check your credentials and connection.")
+            log.error("Failed to initialize strategy. Please check your credentials and connection.")
             return
             
         # Run the strategy with a 5-minute update interval
-        strategy.run_strategy(update_interval=300)
+        asyncio.run(strategy.run_strategy(update_interval=300))
         
-    except KeyboardInterrupt:
-        print("\n👋 Exiting...")
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        log.info("Exiting...")
     except Exception as e:
-        print(f"\n❌ An error occurred: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("An error occurred: %s", e)
     finally:
-        print("\n✅ Script finished")
+        if strategy is not None:
+            strategy.close()
+        log.info("Script finished")
+        _stop_logging(listener)
 
 
 if __name__ == "__main__":
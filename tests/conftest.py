@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Config validates these at import time; tests never talk to the API
+os.environ.setdefault('RAPIDAPI_KEY', 'test-key')
+os.environ.setdefault('MT5_LOGIN', '12345')
+os.environ.setdefault('MT5_PASSWORD', 'test-password')
+os.environ.setdefault('MT5_SERVER', 'test-server')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
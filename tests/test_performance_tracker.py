@@ -0,0 +1,139 @@
+import math
+import random
+
+import pytest
+
+import sector_rotation as sr
+from sector_rotation import PerformanceTracker, Trade
+
+CAPACITY = 5
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    """Tracker with a small ring so tests wrap around quickly"""
+    monkeypatch.setattr(sr.Config, 'TRADE_HISTORY_CAP', CAPACITY)
+    return PerformanceTracker()
+
+
+def expected_metrics(profits):
+    """Reference metrics computed from scratch over every profit"""
+    wins = [p for p in profits if p > 0]
+    losses = [p for p in profits if p <= 0]
+    sum_win = math.fsum(wins)
+    sum_loss = math.fsum(losses)
+    return {
+        'total_trades': len(profits),
+        'win_rate': len(wins) / len(profits) * 100,
+        'total_profit': math.fsum(profits),
+        'avg_win': sum_win / len(wins) if wins else 0,
+        'avg_loss': sum_loss / len(losses) if losses else 0,
+        'profit_factor': sum_win / -sum_loss if sum_loss < 0 else float('inf'),
+    }
+
+
+def assert_metrics(tracker, profits):
+    got = tracker.calculate_performance_metrics()
+    expected = expected_metrics(profits)
+    assert got.keys() == expected.keys()
+    for key, value in expected.items():
+        assert got[key] == pytest.approx(value, rel=1e-12), key
+
+
+def test_empty_tracker(tracker):
+    assert tracker.calculate_performance_metrics() == {}
+    assert tracker.trade_history == []
+
+
+def test_wraparound_keeps_newest_trades(tracker):
+    profits = [float(p) for p in range(-6, 7)]
+    for i, profit in enumerate(profits):
+        tracker.record_trade({'symbol': f'S{i}', 'profit': profit})
+
+    assert_metrics(tracker, profits)
+    retained = [tracker.trade(i) for i in range(CAPACITY)]
+    assert [t.profit for t in retained] == profits[-CAPACITY:]
+    assert [t.symbol for t in retained] == [f'S{i}' for i in range(len(profits) - CAPACITY, len(profits))]
+    assert tracker.trade(-1) == retained[-1]
+    with pytest.raises(IndexError):
+        tracker.trade(CAPACITY)
+
+
+def test_unfolded_trades_are_never_overwritten(tracker):
+    # Several laps of the ring without a metrics call in between
+    rng = random.Random(7)
+    profits = [rng.uniform(-5, 6) for _ in range(4 * CAPACITY + 3)]
+    for profit in profits:
+        tracker.record_trade({'profit': profit})
+    assert_metrics(tracker, profits)
+
+
+def test_interleaved_folds(tracker):
+    rng = random.Random(11)
+    profits = []
+    for _ in range(200):
+        profit = rng.uniform(-5, 6)
+        profits.append(profit)
+        tracker.record_trade({'profit': profit})
+        if rng.random() < 0.3:
+            assert_metrics(tracker, profits)
+    assert_metrics(tracker, profits)
+
+
+def test_batches_match_single_records(tracker):
+    rng = random.Random(3)
+    single = PerformanceTracker()
+    profits = []
+    for _ in range(30):
+        batch = [{'symbol': f'S{len(profits) + i}', 'profit': rng.uniform(-5, 6)}
+                 for i in range(rng.randint(0, 2 * CAPACITY))]
+        profits.extend(t['profit'] for t in batch)
+        tracker.record_trades(batch)
+        for trade in batch:
+            single.record_trade(trade)
+        if rng.random() < 0.5:
+            tracker.calculate_performance_metrics()
+        if rng.random() < 0.3:
+            profit = rng.uniform(-5, 6)
+            profits.append(profit)
+            tracker.record_trade({'symbol': f'S{len(profits) - 1}', 'profit': profit})
+            single.record_trade({'symbol': f'S{len(profits) - 1}', 'profit': profit})
+
+    assert_metrics(tracker, profits)
+    assert_metrics(single, profits)
+    assert [tracker.trade(i)[:2] for i in range(CAPACITY)] == [single.trade(i)[:2] for i in range(CAPACITY)]
+
+
+def test_trade_and_dict_ingestion(tracker):
+    stamp = 1_700_000_000_000_000_000
+    tracker.record_trade(Trade('XLK', 2.0, stamp))
+    tracker.record_trade({'symbol': 'XLF', 'profit': -1.0, 'timestamp_ns': stamp + 1, 'side': 'sell'})
+    tracker.record_trades([Trade('XLE', 0.5, stamp + 2), {'symbol': 'XLU', 'profit': -0.5, 'note': 'mixed'}])
+
+    assert [tracker.trade(i) for i in range(3)] == [
+        Trade('XLK', 2.0, stamp), Trade('XLF', -1.0, stamp + 1), Trade('XLE', 0.5, stamp + 2),
+    ]
+    # A missing timestamp is stamped at record time
+    assert tracker.trade(3).timestamp_ns > stamp
+
+    history = tracker.trade_history
+    assert history[1]['side'] == 'sell'
+    assert history[3]['note'] == 'mixed'
+    assert history[0]['timestamp'] == tracker.iso_timestamp(0)
+    assert_metrics(tracker, [2.0, -1.0, 0.5, -0.5])
+
+
+def test_arrow_round_trip(tracker):
+    pytest.importorskip('pyarrow')
+    stamp = 1_700_000_000_000_000_000
+    for i in range(CAPACITY + 2):
+        tracker.record_trade(Trade(f'S{i}', float(i) - 3, stamp + i))
+
+    table = tracker.as_table()
+    assert table.num_rows == CAPACITY
+    assert table.column('timestamp_ns').to_pylist() == [stamp + i for i in range(2, CAPACITY + 2)]
+
+    copy = PerformanceTracker()
+    copy.record_trades(table)
+    assert [copy.trade(i) for i in range(CAPACITY)] == [tracker.trade(i) for i in range(CAPACITY)]
+    assert_metrics(copy, [float(i) - 3 for i in range(2, CAPACITY + 2)])